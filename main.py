@@ -1,4 +1,5 @@
 import hashlib
+import io
 import json
 import os
 import re
@@ -6,8 +7,13 @@ import shutil
 import sys
 import time
 import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
@@ -16,27 +22,66 @@ from selenium.webdriver.edge.options import Options as EdgeOptions
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
+from selectolax.parser import HTMLParser
+from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def extract_zip_flat(zip_path, target_dir):
-    """扁平化解压ZIP文件到目标目录（忽略所有嵌套层级）"""
-    try:
-        os.makedirs(target_dir, exist_ok=True)
+try:
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
+# 优先使用ISA-L的DEFLATE实现（SIMD加速，接口与zlib一致），未安装时回退到标准库zlib
+DEFLATE_MODULE = isal_zlib if isal_zlib is not None else zlib
+# zipfile解压与CRC校验同样改用ISA-L
+zipfile.zlib = DEFLATE_MODULE
+zipfile.crc32 = DEFLATE_MODULE.crc32
+
+MAPS_URL = "https://zh-cn.ubisoft.com/r6s/maps"
+MAP_URL_TEMPLATE = "https://zh-cn.ubisoft.com/r6s/map?name={}"
+# 地图页面中的蓝图下载按钮
+DOWNLOAD_SELECTOR = 'a[data-innertext*="download blueprints"]'
+
+# 地图列表页中的maps变量及其未加引号的键名
+MAPS_RE = re.compile(r'var\s+maps\s*=\s*(\[.*?\])', re.DOTALL)
+KEY_RE = re.compile(r'(\w+):')
 
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            for zip_info in zip_ref.infolist():
-                if '__MACOSX' in zip_info.filename:
-                    continue
-                if zip_info.is_dir():
-                    continue
+# 复用连接池，避免每个地图重复建立TCP/TLS连接
+SESSION = requests.Session()
+SESSION.headers.update({"Connection": "keep-alive"})
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                                      max_retries=Retry(total=3, backoff_factor=0.5)))
 
-                file_name = os.path.basename(zip_info.filename)
-                if not file_name:
-                    continue
 
-                target_file = os.path.join(target_dir, file_name)
-                with zip_ref.open(zip_info) as src_file, open(target_file, 'wb') as dst_file:
-                    shutil.copyfileobj(src_file, dst_file)
+def parse_json(text):
+    """解析JSON文本，优先使用orjson，未安装时回退到标准库json"""
+    if orjson is not None:
+        return orjson.loads(text.encode())
+    return json.loads(text)
+
+
+# 小于该大小的压缩包条目整体读入内存后一次写出
+SMALL_ENTRY_SIZE = 4 * 1024 * 1024
+
+
+def extract_zip_flat(zip_file, target_dir):
+    """扁平化解压ZIP文件（路径或文件对象）到目标目录（忽略所有嵌套层级）"""
+    try:
+        os.makedirs(target_dir, exist_ok=True)
+        # 支持dir_fd的平台只打开一次目标目录，后续按文件名相对打开，避免每个文件重复解析路径
+        dir_fd = None
+        if os.open in os.supports_dir_fd:
+            dir_fd = os.open(target_dir, os.O_RDONLY | os.O_DIRECTORY)
+
+        try:
+            extract_entries(zip_file, target_dir, dir_fd)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
 
         return True
     except Exception as e:
@@ -44,37 +89,176 @@ def extract_zip_flat(zip_path, target_dir):
         return False
 
 
-def zip_folder(folder_path, zip_path):
+def open_target_file(target_dir, dir_fd, file_name):
+    """以二进制写模式打开解压目标文件"""
+    if dir_fd is None:
+        return open(os.path.join(target_dir, file_name), 'wb')
+    fd = os.open(file_name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666, dir_fd=dir_fd)
+    return os.fdopen(fd, 'wb')
+
+
+def extract_entries(zip_file, target_dir, dir_fd):
+    """将压缩包内所有文件扁平化写入目标目录"""
+    with zipfile.ZipFile(zip_file, 'r') as zip_ref:
+        for zip_info in zip_ref.infolist():
+            if '__MACOSX' in zip_info.filename:
+                continue
+            if zip_info.is_dir():
+                continue
+
+            file_name = os.path.basename(zip_info.filename)
+            if not file_name:
+                continue
+
+            with zip_ref.open(zip_info) as src_file, \
+                    open_target_file(target_dir, dir_fd, file_name) as dst_file:
+                # 小文件一次读写，减少系统调用次数
+                if zip_info.file_size < SMALL_ENTRY_SIZE:
+                    dst_file.write(src_file.read())
+                else:
+                    # 大文件预分配空间后分块复制
+                    if hasattr(os, 'posix_fallocate'):
+                        os.posix_fallocate(dst_file.fileno(), 0, zip_info.file_size)
+                    shutil.copyfileobj(src_file, dst_file, length=1024 * 1024)
+
+
+# 已压缩格式直接存储，再次DEFLATE几乎无收益
+STORED_EXTENSIONS = ('.zip', '.png', '.jpg', '.jpeg')
+# 压缩包内固定时间戳（避免受系统时间影响）
+ZIP_DATE_TIME = (2015, 11, 28, 0, 0, 0)
+
+
+def list_folder_files(folder_path):
+    """按名称排序列出目录下所有文件的相对路径，确保遍历顺序一致"""
+    arcnames = []
+    for root, dirs, files in os.walk(folder_path):
+        if '__MACOSX' in dirs:
+            dirs.remove('__MACOSX')
+        dirs.sort()
+        for file in sorted(files):
+            arcnames.append(os.path.relpath(os.path.join(root, file), folder_path))
+    return arcnames
+
+
+def compress_file(file_path, stored):
+    """读取并压缩单个文件（直接存储时不压缩），返回(压缩数据, CRC, 原始大小)"""
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    crc = DEFLATE_MODULE.crc32(data)
+    file_size = len(data)
+    if not stored:
+        # 与zipfile一致的raw deflate流（wbits=-15）
+        compressor = DEFLATE_MODULE.compressobj(1, DEFLATE_MODULE.DEFLATED, -15)
+        data = compressor.compress(data) + compressor.flush()
+    return data, crc, file_size
+
+
+# 同时在途的压缩任务数上限，已压缩数据在写入前最多占用 MAX_PENDING_FILES × SMALL_ENTRY_SIZE 级别的内存
+MAX_PENDING_FILES = (os.cpu_count() or 1) * 2
+
+
+def new_zip_info(arcname, stored):
+    """创建固定时间戳与权限的ZipInfo，保证压缩包内容可复现"""
+    zip_info = zipfile.ZipInfo(arcname)
+    zip_info.date_time = ZIP_DATE_TIME
+    zip_info.compress_type = zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED
+    zip_info.external_attr = 0o600 << 16  # 与ZipFile.open写入时的默认权限一致
+    return zip_info
+
+
+def append_precompressed(zipf, zip_info, data):
+    """将已压缩的数据直接追加到压缩包并登记到中央目录
+
+    依赖CPython zipfile（3.8–3.13）的内部状态，与ZipFile._open_to_write及写入句柄关闭时的处理一致：
+    fp为当前写入位置，start_dir为中央目录起点，filelist/NameToInfo为中央目录条目，
+    _didModify为True时close才会写出中央目录。
+    """
+    zip64 = zip_info.file_size > zipfile.ZIP64_LIMIT or zip_info.compress_size > zipfile.ZIP64_LIMIT
+    zip_info.header_offset = zipf.fp.tell()
+    zipf.fp.write(zip_info.FileHeader(zip64))
+    zipf.fp.write(data)
+    zipf.start_dir = zipf.fp.tell()
+    zipf.filelist.append(zip_info)
+    zipf.NameToInfo[zip_info.filename] = zip_info
+    zipf._didModify = True
+
+
+def write_pending(zipf, pending, keep):
+    """按提交顺序写出已完成的压缩任务，直到在途任务不超过keep个"""
+    while len(pending) > keep:
+        zip_info, future = pending.popleft()
+        data, crc, file_size = future.result()
+        zip_info.file_size = file_size
+        zip_info.compress_size = len(data)
+        zip_info.CRC = crc
+        append_precompressed(zipf, zip_info, data)
+
+
+def write_zip_entries(folder_path, zip_file, arcnames):
+    """使用zipfile写入文件，小文件在进程池中并行压缩，大文件流式写入"""
+    pending = deque()
+    with ProcessPoolExecutor() as executor, \
+            zipfile.ZipFile(zip_file, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+        for arcname in arcnames:
+            file_path = os.path.join(folder_path, arcname)
+            stored = arcname.lower().endswith(STORED_EXTENSIONS)
+            zip_info = new_zip_info(arcname, stored)
+            file_size = os.path.getsize(file_path)
+
+            if file_size < SMALL_ENTRY_SIZE:
+                if stored:
+                    # 直接存储的文件无需压缩，在主进程读取，避免跨进程传输原始数据
+                    future = Future()
+                    future.set_result(compress_file(file_path, stored))
+                else:
+                    future = executor.submit(compress_file, file_path, stored)
+                # 统一放入队列，保持提交顺序写出
+                pending.append((zip_info, future))
+                write_pending(zipf, pending, MAX_PENDING_FILES)
+                continue
+
+            # 大文件：先按顺序写完在途任务，再分块流式写入，避免整文件读入内存
+            write_pending(zipf, pending, 0)
+            # 传入ZipInfo时构造函数的compresslevel不生效，需显式指定
+            zip_info._compresslevel = 1
+            zip_info.file_size = file_size
+            with open(file_path, 'rb') as src, zipf.open(zip_info, 'w') as dst:
+                shutil.copyfileobj(src, dst, length=1024 * 1024)
+
+        write_pending(zipf, pending, 0)
+
+
+class HashingWriter:
+    """写入底层文件的同时更新哈希，避免打包后再完整读取一遍压缩包"""
+
+    def __init__(self, fp, hash_obj):
+        self.fp = fp
+        self.hash_obj = hash_obj
+
+    def write(self, data):
+        self.hash_obj.update(data)
+        return self.fp.write(data)
+
+    def flush(self):
+        self.fp.flush()
+
+
+def zip_folder(folder_path, zip_path, algorithm='blake2b'):
+    """打包目录，写入时同步计算哈希（仅用于比对两次结果，默认使用更快的BLAKE2b），失败返回None"""
     try:
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zipf:
-            for root, dirs, files in os.walk(folder_path):
-                if '__MACOSX' in dirs:
-                    dirs.remove('__MACOSX')
-                # 强制文件按名称排序，确保遍历顺序一致
-                for file in sorted(files):
-                    file_path = os.path.join(root, file)
-                    arcname = os.path.relpath(file_path, folder_path)
-                    # 创建ZipInfo对象，固定时间戳（避免受系统时间影响）
-                    zip_info = zipfile.ZipInfo(arcname)
-                    zip_info.date_time = (2015, 11, 28, 0, 0, 0)  # 固定为2020-01-01 00:00:00
-                    zip_info.compress_type = zipfile.ZIP_DEFLATED
-                    # 写入文件内容（忽略原文件元数据）
-                    with open(file_path, 'rb') as f:
-                        zipf.writestr(zip_info, f.read())
+        arcnames = list_folder_files(folder_path)
+
+        hash_obj = hashlib.new(algorithm)
+        with open(zip_path, 'wb') as f:
+            write_zip_entries(folder_path, HashingWriter(f, hash_obj), arcnames)
         print(f"成功打包: {zip_path}")
-        return True
+        return hash_obj.hexdigest()
     except Exception as e:
         print(f"打包失败: {str(e)}")
-        return False
-
-
-def calculate_file_hash(file_path, algorithm='sha256'):
-    """计算文件哈希值"""
-    hash_obj = hashlib.new(algorithm)
-    with open(file_path, 'rb') as f:
-        while chunk := f.read(8192):
-            hash_obj.update(chunk)
-    return hash_obj.hexdigest()
+        # 删除不完整的压缩包
+        if os.path.exists(zip_path):
+            os.remove(zip_path)
+        return None
 
 
 def cleanup_resources(keep_first_zip=False):
@@ -98,8 +282,38 @@ def cleanup_resources(keep_first_zip=False):
                     print(f"清理{file}失败: {str(e)}")
 
 
-def run_crawl(zip_suffix=""):
-    """执行单次爬取流程，返回(是否有错误, 压缩包哈希, 压缩包路径)"""
+def download_and_extract(map_name, download_url, download_dir):
+    """下载单个地图压缩包并扁平化解压，返回地图状态"""
+    # 使用with确保响应关闭，出错时连接也能归还连接池
+    with SESSION.get(download_url, stream=True, timeout=30) as response:
+        if response.status_code != 200:
+            raise Exception(f"地图压缩包{response.status_code}")
+
+        # 直接下载到内存中解压，省去临时文件的写入和读取
+        buffer = io.BytesIO()
+        for chunk in response.iter_content(chunk_size=1024 * 1024):
+            if chunk:
+                buffer.write(chunk)
+    buffer.seek(0)
+
+    map_target_dir = os.path.join(download_dir, map_name)
+    if extract_zip_flat(buffer, map_target_dir):
+        return "正常"
+    raise Exception("解压失败")
+
+
+def format_map_error(e):
+    """将单个地图的异常转换为状态描述"""
+    error_msg = str(e)
+    if "404" in error_msg:
+        return "地图压缩包404"
+    elif "下载链接为空" in error_msg:
+        return "地图链接404"
+    return error_msg
+
+
+def create_driver():
+    """根据操作系统创建无头浏览器驱动"""
     # 根据操作系统选择浏览器和驱动
     if sys.platform.startswith('win32'):
         # Windows环境：使用Edge浏览器
@@ -111,8 +325,7 @@ def run_crawl(zip_suffix=""):
         try:
             service = EdgeService(executable_path="./msedgedriver.exe")
         except Exception as e:
-            print(f"Edge驱动配置异常: {e}")
-            return True, None, None  # 返回错误状态
+            raise Exception(f"Edge驱动配置异常: {e}")
     else:
         # Linux环境（GitHub Action）：使用Chrome浏览器
         options = ChromeOptions()
@@ -125,106 +338,150 @@ def run_crawl(zip_suffix=""):
         try:
             service = ChromeService(executable_path="/usr/bin/chromedriver")
         except Exception as e:
-            print(f"Chrome驱动配置异常: {e}")
-            return True, None, None  # 返回错误状态
+            raise Exception(f"Chrome驱动配置异常: {e}")
 
     # 初始化驱动
     try:
         if sys.platform.startswith('win32'):
-            driver = webdriver.Edge(service=service, options=options)
-        else:
-            driver = webdriver.Chrome(service=service, options=options)
+            return webdriver.Edge(service=service, options=options)
+        return webdriver.Chrome(service=service, options=options)
     except Exception as e:
-        print(f"浏览器初始化失败: {e}")
-        return True, None, None
+        raise Exception(f"浏览器初始化失败: {e}")
+
+
+def parse_maps_source(page_source):
+    """从页面源码中提取maps变量，未找到时返回None"""
+    match = MAPS_RE.search(page_source)
+    if not match:
+        return None
+
+    maps_json = match.group(1).replace("'", '"')
+    maps_json = KEY_RE.sub(r'"\1":', maps_json)
+    return parse_json(maps_json)
+
+
+def find_download_url(page_source, page_url):
+    """从地图页面源码中提取蓝图下载链接（转换为绝对地址），未找到时返回None"""
+    node = HTMLParser(page_source).css_first(DOWNLOAD_SELECTOR)
+    href = node.attributes.get('href') if node else None
+    return urljoin(page_url, href) if href else None
+
+
+def find_download_url_with_driver(driver, map_url):
+    """使用浏览器渲染地图页面并获取蓝图下载链接"""
+    driver.get(map_url)
+
+    # WebDriverWait会轮询等待按钮出现，无需额外固定等待
+    download_button = WebDriverWait(driver, 3).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, DOWNLOAD_SELECTOR))
+            )
+    return download_button.get_attribute("href")
+
+
+# 重试也无法恢复的状态（上游已移除的地图），仅出现这些状态时不再重复爬取
+PERMANENT_STATUSES = ("正常", "地图压缩包404", "地图链接404")
+
 
+def has_transient_error(map_status):
+    """判断是否存在可能通过重试恢复的错误（超时、服务器错误、打包失败等）"""
+    return any(status not in PERMANENT_STATUSES for status in map_status.values())
+
+
+def run_crawl(zip_suffix=""):
+    """执行单次爬取流程，返回(是否有错误, 压缩包哈希, 压缩包路径, 各地图状态)"""
     download_dir = "./maps"
     os.makedirs(download_dir, exist_ok=True)
     map_status = {}
     has_error = False
     total_maps = 0
-    file_hash = None
     zip_path = f"./r6maps{zip_suffix}.zip"  # 支持自定义后缀
 
+    driver = None
+
     try:
-        # 访问地图列表页面
-        driver.get("https://zh-cn.ubisoft.com/r6s/maps")
-        WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "maps-list"))
-                )
-
-        # 获取地图数据
-        maps_data = []
+        # 优先直接请求地图列表页，静态HTML中已包含maps变量，无需启动浏览器
+        maps_data = None
         try:
-            maps_data = driver.execute_script("return maps;")
+            response = SESSION.get(MAPS_URL, timeout=15)
+            if response.status_code == 200:
+                maps_data = parse_maps_source(response.text)
         except Exception as e:
-            page_source = driver.page_source
-            maps_pattern = re.compile(r'var\s+maps\s*=\s*(\[.*?\])', re.DOTALL)
-            match = maps_pattern.search(page_source)
-            if not match:
-                raise ValueError("无法获取地图数据")
+            print(f"直接获取地图列表失败: {e}")
 
-            maps_json = match.group(1).replace("'", '"')
-            maps_json = re.sub(r'(\w+):', r'"\1":', maps_json)
-            maps_data = json.loads(maps_json)
+        if maps_data is None:
+            # 回退：使用浏览器访问地图列表页面
+            driver = create_driver()
+            driver.get(MAPS_URL)
+            WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CLASS_NAME, "maps-list"))
+                    )
 
-        # 处理每个地图
+            try:
+                maps_data = driver.execute_script("return maps;")
+            except Exception as e:
+                maps_data = parse_maps_source(driver.page_source)
+                if maps_data is None:
+                    raise ValueError("无法获取地图数据")
+
+        # 处理每个地图：先串行获取下载链接（浏览器驱动非线程安全）
         total_maps = len(maps_data)
+        download_tasks = []
         for map_info in maps_data:
             map_name = map_info["name"]
-            map_url = f"https://zh-cn.ubisoft.com/r6s/map?name={map_info['url']}"
+            map_url = MAP_URL_TEMPLATE.format(map_info['url'])
 
             try:
-                driver.get(map_url)
-                time.sleep(1)
+                download_url = None
+                try:
+                    response = SESSION.get(map_url, timeout=15)
+                    if response.status_code == 200:
+                        download_url = find_download_url(response.text, map_url)
+                except Exception as e:
+                    print(f"直接获取{map_name}页面失败: {e}")
 
-                download_button = WebDriverWait(driver, 3).until(
-                        EC.presence_of_element_located(
-                                (By.XPATH, '//a[contains(@data-innertext, "download blueprints")]')
-                                )
-                        )
+                # 静态HTML中未找到链接时回退到浏览器渲染
+                if not download_url:
+                    if driver is None:
+                        driver = create_driver()
+                    download_url = find_download_url_with_driver(driver, map_url)
 
-                download_url = download_button.get_attribute("href")
                 if not download_url:
                     raise ValueError("下载链接为空")
 
-                temp_zip_path = os.path.join(download_dir, f"{map_name}.zip")
-                response = requests.get(download_url, stream=True, timeout=30)
-
-                if response.status_code != 200:
-                    raise Exception(f"地图压缩包{response.status_code}")
-
-                with open(temp_zip_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-
-                map_target_dir = os.path.join(download_dir, map_name)
-                if extract_zip_flat(temp_zip_path, map_target_dir):
-                    os.remove(temp_zip_path)
-                    map_status[map_name] = "正常"
-                else:
-                    raise Exception("解压失败")
+                download_tasks.append((map_name, download_url))
+                # 先按地图列表顺序占位，保证日志输出顺序与并发完成顺序无关
+                map_status[map_name] = "待下载"
 
             except Exception as e:
-                error_msg = str(e)
-                if "404" in error_msg:
-                    map_status[map_name] = f"地图压缩包404"
-                elif "下载链接为空" in error_msg:
-                    map_status[map_name] = "地图链接404"
-                else:
-                    map_status[map_name] = error_msg
+                map_status[map_name] = format_map_error(e)
                 has_error = True
 
+        # 再并发下载并解压（I/O密集，线程池即可）
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                executor.submit(download_and_extract, map_name, download_url, download_dir): map_name
+                for map_name, download_url in download_tasks
+                }
+            for future in as_completed(futures):
+                map_name = futures[future]
+                try:
+                    status = future.result()
+                except Exception as e:
+                    status = format_map_error(e)
+                    has_error = True
+                # 结果在主线程中汇总，无需加锁
+                map_status[map_name] = status
+
     except Exception as e:
         map_status["全局"] = f"爬取流程异常: {str(e)}"
         has_error = True
     finally:
-        driver.quit()
+        if driver is not None:
+            driver.quit()
 
     # 打包maps文件夹
-    zip_result = zip_folder(download_dir, zip_path)
-    if not zip_result:
+    file_hash = zip_folder(download_dir, zip_path)
+    if not file_hash:
         map_status["打包"] = f"{zip_path}打包失败"
         has_error = True
 
@@ -233,15 +490,13 @@ def run_crawl(zip_suffix=""):
     for name, status in map_status.items():
         print(f"{name}：{status}")
 
-    # 计算哈希值
-    if os.path.exists(zip_path):
-        file_hash = calculate_file_hash(zip_path)
-        # 保存哈希值到对应文件
+    # 保存打包时计算的哈希值到对应文件
+    if file_hash:
         with open(f"./hash{zip_suffix}.txt", "w") as f:
             f.write(file_hash)
         print(f"\n文件哈希值: {file_hash}")
 
-    return has_error, file_hash, zip_path
+    return has_error, file_hash, zip_path, map_status
 
 
 def main():
@@ -250,16 +505,17 @@ def main():
 
     # 第一次爬取（生成带first后缀的压缩包）
     print("===== 第一次爬取开始 =====")
-    first_error, first_hash, first_zip = run_crawl("_first")
+    first_error, first_hash, first_zip, first_status = run_crawl("_first")
 
-    # 如果第一次无错误，直接正常退出
-    if not first_error:
+    # 如果第一次无错误，或错误均为404等重试无法恢复的情况，直接正常退出
+    if not first_error or not has_transient_error(first_status):
+        if first_error:
+            print("\n===== 错误均为永久性404，跳过重试 =====")
         # 重命名为默认名称用于后续流程
         if os.path.exists(first_zip):
-            shutil.copy2(first_zip, "./r6maps.zip")
-            with open("./hash_first.txt", "r") as f:
-                with open("./hash.txt", "w") as out_f:
-                    out_f.write(f.read())
+            os.replace(first_zip, "./r6maps.zip")
+            with open("./hash.txt", "w") as f:
+                f.write(first_hash)
         sys.exit(0)
 
     # 第一次有错误，执行重试逻辑
@@ -269,7 +525,7 @@ def main():
 
     # 第二次爬取（生成带second后缀的压缩包）
     print("\n===== 第二次爬取开始 =====")
-    second_error, second_hash, second_zip = run_crawl("_second")
+    second_error, second_hash, second_zip, _ = run_crawl("_second")
 
     # 对比两次哈希
     print("\n===== 爬取结果对比 =====")
@@ -280,10 +536,9 @@ def main():
     if first_hash and second_hash and first_hash == second_hash:
         print("两次哈希一致")
         # 用第一次的结果作为最终结果
-        shutil.copy2(first_zip, "./r6maps.zip")
-        with open("./hash_first.txt", "r") as f:
-            with open("./hash.txt", "w") as out_f:
-                out_f.write(f.read())
+        os.replace(first_zip, "./r6maps.zip")
+        with open("./hash.txt", "w") as f:
+            f.write(first_hash)
         sys.exit(0)
     else:
         print("两次哈希不一致")